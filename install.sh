@@ -52,7 +52,7 @@ Type=simple
 User=$RUN_USER
 WorkingDirectory=$INSTALL_DIR
 ExecStart=$VENV_DIR/bin/python $INSTALL_DIR/$SCRIPT_NAME
-SupplementaryGroups=i2c
+SupplementaryGroups=i2c video
 Restart=on-failure
 RestartSec=10s
 
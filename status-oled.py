@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
-import os, time, socket, shutil, re
-from datetime import datetime
-from subprocess import run
+import os, time, socket, shutil, re, functools, string, threading, queue, struct, array, fcntl, errno, select, signal
+from dataclasses import dataclass
+from typing import Optional
 
-import psutil
 from PIL import ImageFont, Image, ImageDraw
+import luma.core.error
 from luma.core.interface.serial import i2c
-from luma.core.render import canvas
 from luma.oled.device import ssd1306
 
 # ---------- Config ----------
@@ -23,70 +22,218 @@ SCROLL_SPEED_PX = 4      # pixels per frame when scrolling
 SCROLL_TICK_S = 0.1      # 10 FPS (reduced from 20 FPS)
 SCROLL_GAP_PX = 24       # gap between repeated copies
 CACHE_SECONDS = 2        # cache expensive operations for 2 seconds
+DISK_CACHE_SECONDS = 30  # disk usage barely moves, refresh it less often
+STAT_REFRESH_SECONDS = 1 # re-run the displayed stat producer at most this often
+# sysfs/procfs sources (read directly instead of forking vcgencmd or via psutil)
+PROC_STAT_PATH = "/proc/stat"
+MEMINFO_PATH = "/proc/meminfo"
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"                  # millidegrees C
+THROTTLED_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"  # hex bitmask
+VCIO_PATH = "/dev/vcio"  # VideoCore mailbox, used when get_throttled is missing
 
 # Anti burn-in: horizontal sweep to distribute pixel wear
 BURNIN_SHIFT_SECONDS = 30   # shift position every N seconds
 BURNIN_SHIFT_MAX_X = 3      # max horizontal shift in pixels (sweeps left/right)
 # ----------------------------
 
+# Precompiled pattern for scroll-preserving text templates: IP addresses
+# (group 1) or digits, decimal numbers and percentages, in a single pass
+_TEMPLATE_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)|(\d+\.?\d*%?)')
+
+# get_throttled bits, in the order temp_line() lists them
+_THROTTLE_LABELS = (
+    (0x1, 'UV'),        # Under-voltage detected
+    (0x2, 'THROT'),     # Currently throttled
+    (0x4, 'CAP'),       # Currently capped
+    (0x8, 'SOFT'),      # Currently soft temperature limit
+    (0x10000, 'UV-H'),  # Under-voltage has occurred
+    (0x20000, 'TH-H'),  # Throttling has occurred
+)
+# Short form for the CPU line: thermal throttling, then under-voltage
+_THROTTLE_LABELS_SHORT = ((0x2, 'THROT'), (0x1, 'UV'))
+
+# VideoCore property mailbox: _IOWR(100, 0, char *) and the tags we query
+_MBOX_PROPERTY = (3 << 30) | (struct.calcsize("P") << 16) | (100 << 8)
+_MBOX_GET_THROTTLED = 0x00030046
+_MBOX_MEASURE_TEMP = 0x00030006
+
+# Values that never change while the service runs; read once at startup
+HOSTNAME = socket.gethostname()
+
+@dataclass
+class Cache:
+    """Sampled system values: refreshed by refresh_cache(), read by the line producers"""
+    vcg_time: float = 0
+    throttle_short: str = ''
+    throttle_long: str = ''
+    temp_c: Optional[float] = None
+    cpu_time: float = 0
+    cpu_val: float = 0.0
+    cpu_prev: Optional[tuple] = None
+    ip_time: float = 0
+    ip_val: str = '0.0.0.0'
+    mem_time: float = 0
+    mem_val: tuple = ('0B', '0B', 0)
+    disk_time: float = 0
+    disk_val: tuple = ('0B', '0B', 0)
+    stat_time: float = 0
+    stat_idx: Optional[int] = None
+    stat_val: str = ''
+
 # Global cache for expensive operations
-_cache = {
-    'vcgencmd_data': {'time': 0, 'throttled': '0x0', 'temp': 'N/A'},
-    'cpu_percent': {'time': 0, 'value': 0.0},
-    'ip_addr': {'time': 0, 'value': '0.0.0.0'}
-}
+_cache = Cache()
+
+# sysfs/device fds, opened once and reused for the life of the process
+_open_fds = {}
 
 # ---------- Helpers ----------
-def get_cached_vcgencmd_data():
-    """Cache expensive vcgencmd calls"""
-    now = time.monotonic()
-    cache = _cache['vcgencmd_data']
-    
-    if now - cache['time'] > CACHE_SECONDS:
-        try:
-            # Get throttling and temperature data
-            throttled_result = run(["vcgencmd", "get_throttled"], capture_output=True, text=True)
-            temp_result = run(["vcgencmd", "measure_temp"], capture_output=True, text=True)
-            
-            cache['throttled'] = throttled_result.stdout.strip() if throttled_result.returncode == 0 else "throttled=0x0"
-            cache['temp'] = temp_result.stdout.strip() if temp_result.returncode == 0 else "temp=0.0'C"
-            cache['time'] = now
-        except Exception:
-            pass
-    
-    return cache
+def open_cached_fd(path, flags=os.O_RDONLY):
+    fd = _open_fds.get(path)
+    if fd is None:
+        fd = _open_fds[path] = os.open(path, flags)
+    return fd
 
-def get_cached_cpu_percent():
-    """Cache CPU percentage with less frequent updates"""
-    now = time.monotonic()
-    cache = _cache['cpu_percent']
-    
-    if now - cache['time'] > 1:  # Update every 1 second instead of 2
-        try:
-            # Use psutil.cpu_percent() without interval for non-blocking call
-            cache['value'] = psutil.cpu_percent()
-            cache['time'] = now
-        except Exception:
-            cache['value'] = 0.0
-    
-    return cache['value']
+def read_sysfs(path):
+    """Read a single value from sysfs/procfs: one pread on a kept-open fd"""
+    return os.pread(open_cached_fd(path), 4096, 0).decode().strip()
 
-def get_cached_ip():
-    """Cache IP address lookup"""
-    now = time.monotonic()
-    cache = _cache['ip_addr']
-    
-    if now - cache['time'] > 10:  # Cache IP for 10 seconds
-        try:
-            ip = os.popen("hostname -I").read().strip().split()[0]
-            cache['value'] = ip
-            cache['time'] = now
-        except Exception:
-            pass
+def mailbox_properties(*requests):
+    """Several property tags in one /dev/vcio round trip (what vcgencmd uses)
+
+    Each request is (tag, value words, *values); returns each tag's value words.
+    """
+    # size, request code, then per tag: tag, value buffer size, tag request
+    # code, values; the firmware answers in place, followed by the end tag
+    words = [0, 0]
+    spans = []
+    for tag, n, *values in requests:
+        words += [tag, n * 4, 0]
+        spans.append((len(words), n))
+        words += values + [0] * (n - len(values))
+    words.append(0)
+    words[0] = len(words) * 4
+    buf = array.array("I", words)
+    fcntl.ioctl(open_cached_fd(VCIO_PATH, os.O_RDWR), _MBOX_PROPERTY, buf, True)
+    if buf[1] != 0x80000000:
+        raise OSError("mailbox property request failed")
+    return [buf[i:i + n].tolist() for i, n in spans]
+
+def read_firmware_status():
+    """(throttling bitmask, millidegrees C or None if thermal sysfs should be used)"""
+    try:
+        return int(read_sysfs(THROTTLED_PATH), 16), None
+    except FileNotFoundError:
+        # Older kernels: ask the firmware for both values in one message. The
+        # get_throttled word is a mask of sticky bits to clear; 0 keeps history
+        (throttled,), (_, millideg) = mailbox_properties(
+            (_MBOX_GET_THROTTLED, 1, 0), (_MBOX_MEASURE_TEMP, 2, 0))
+        return throttled, millideg
+
+def refresh_vcgencmd_data(cache, now):
+    """Throttling and temperature data from sysfs or the mailbox (no subprocess)"""
+    millideg = None
+    try:
+        throttled_val, millideg = read_firmware_status()
+    except Exception:
+        throttled_val = 0
+    # Decode the bitmask into label strings once per refresh, not per line
+    cache.throttle_short = "".join(f" {label}" for bit, label in _THROTTLE_LABELS_SHORT if throttled_val & bit)
+    cache.throttle_long = " ".join(label for bit, label in _THROTTLE_LABELS if throttled_val & bit)
+    try:
+        if millideg is None:
+            millideg = int(read_sysfs(THERMAL_PATH))
+        cache.temp_c = millideg / 1000
+    except Exception:
+        # No sensor reading: temp_line shows N/A rather than a made-up 0.0
+        cache.temp_c = None
+    cache.vcg_time = now
+
+def read_cpu_times():
+    """(busy, total) jiffies from the aggregate cpu line of /proc/stat"""
+    line = os.pread(open_cached_fd(PROC_STAT_PATH), 256, 0).split(b"\n", 1)[0]
+    # user nice system idle iowait irq softirq steal (guest is already in user)
+    fields = [int(v) for v in line.split()[1:9]]
+    total = sum(fields)
+    return total - fields[3] - fields[4], total
+
+def read_meminfo():
+    """(total, available) bytes from /proc/meminfo, sliced without a regex"""
+    data = os.pread(open_cached_fd(MEMINFO_PATH), 512, 0)  # both keys are in the first lines
+    def kb(key):
+        i = data.index(key) + len(key)
+        return int(data[i:data.index(b"kB", i)]) * 1024
+    return kb(b"MemTotal:"), kb(b"MemAvailable:")
+
+def refresh_cpu_percent(cache, now):
+    """CPU percentage from /proc/stat deltas (non-blocking)"""
+    try:
+        busy, total = read_cpu_times()
+        if cache.cpu_prev is not None and total > cache.cpu_prev[1]:
+            prev_busy, prev_total = cache.cpu_prev
+            cache.cpu_val = 100.0 * (busy - prev_busy) / (total - prev_total)
+        cache.cpu_prev = (busy, total)
+        cache.cpu_time = now
+    except Exception:
+        cache.cpu_val = 0.0
+
+def refresh_ip(cache, now):
+    """IP address lookup (socket based, no subprocess)"""
+    try:
+        # UDP connect() only selects a route, no packets are sent
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("10.255.255.255", 1))
+            cache.ip_val = s.getsockname()[0]
+        cache.ip_time = now
+    except Exception:
+        pass
+
+def refresh_mem(cache, now):
+    """Memory usage as formatted (used, total, percent)"""
+    try:
+        total, available = read_meminfo()
+        used = total - available
+        cache.mem_val = (bytes2human(used), bytes2human(total), int(round(100 * used / total, 1)))
+        cache.mem_time = now
+    except Exception:
+        pass
+
+def refresh_disk(cache, now):
+    """Root filesystem usage as formatted (used, total, percent)"""
+    try:
+        du = shutil.disk_usage("/")
+        used = du.total - du.free
+        cache.disk_val = (bytes2human(used), bytes2human(du.total), int(100*used/du.total))
+        cache.disk_time = now
+    except Exception:
+        pass
+
+def refresh_cache(cache, now):
+    """Refresh whatever has expired; all TTLs are checked here, once per tick"""
+    if now - cache.vcg_time > CACHE_SECONDS:
+        refresh_vcgencmd_data(cache, now)
+    if now - cache.cpu_time > 1:  # Update every 1 second instead of 2
+        refresh_cpu_percent(cache, now)
+    if now - cache.mem_time > CACHE_SECONDS:
+        refresh_mem(cache, now)
+    if now - cache.ip_time > 10:  # Cache IP for 10 seconds
+        refresh_ip(cache, now)
+    if now - cache.disk_time > DISK_CACHE_SECONDS:
+        refresh_disk(cache, now)
+
+def get_cached_stat_line(cache, stats, idx, now):
+    """Cache the rotating stat string; producers only re-run on rotation or TTL"""
+    # Uses the loop's clock so a wakeup scheduled for the refresh always hits it
+    if cache.stat_idx != idx or now - cache.stat_time >= STAT_REFRESH_SECONDS:
+        cache.stat_val = stats[idx % len(stats)]()
+        cache.stat_idx = idx
+        cache.stat_time = now
     
-    return cache['value']
+    return cache.stat_val
 
+@functools.lru_cache(maxsize=None)
 def load_font(size):
+    # One font object per size, so lines sharing a size also share the
+    # glyph atlas and render cache entries (both are keyed by font)
     for p in FONT_PATHS:
         try:
             return ImageFont.truetype(p, size)
@@ -94,101 +241,47 @@ def load_font(size):
             pass
     return ImageFont.load_default()
 
+_SYMBOLS = ('', 'K', 'M', 'G', 'T')
+
 def bytes2human(n):
-    symbols = ('K', 'M', 'G', 'T')
-    for i in range(len(symbols)-1, -1, -1):
-        thresh = 1 << ((i + 1) * 10)
-        if n >= thresh:
-            return f"{int(n / thresh)}{symbols[i]}"
-    return f"{n}B"
+    # Unit index straight from the bit length: one C call, no loop or float divide
+    k = min((n.bit_length() - 1) // 10, 4) if n else 0
+    return f"{n >> (k * 10)}{_SYMBOLS[k]}" if k else f"{n}B"
 
 def up_line():
-    uptime = datetime.now() - datetime.fromtimestamp(psutil.boot_time())
-    hours, mins = divmod(int(uptime.total_seconds() // 60), 60)
+    # Time since boot straight from the kernel; unlike wall-clock minus btime
+    # it is unaffected by the NTP step on Pis without an RTC
+    hours, mins = divmod(int(time.clock_gettime(time.CLOCK_BOOTTIME)) // 60, 60)
     return f"Up:{hours}h{mins}m"
 
-def host_line():
-    return socket.gethostname()
-
 def ip_line():
-    ip = get_cached_ip()
+    ip = _cache.ip_val
     return f"IP:{ip}"
 
 def load_line():
     # Get cached CPU percentage and throttling status
-    cpu_percent = get_cached_cpu_percent()
-    
-    # Get cached throttling data
-    vcgencmd_data = get_cached_vcgencmd_data()
-    
-    try:
-        throttled_hex = vcgencmd_data['throttled'].split('=')[1]
-        throttled_val = int(throttled_hex, 16)
-        
-        # Parse throttling bits
-        currently_throttled = throttled_val & 0x2  # Bit 1: Currently throttled
-        temp_limit = throttled_val & 0x1           # Bit 0: Under-voltage detected
-        
-        # Create status indicator
-        status = ""
-        if currently_throttled:
-            status += " THROT"  # Thermal throttling
-        if temp_limit:
-            status += " UV"     # Under-voltage
-            
-        return f"CPU: {cpu_percent:.1f}%{status}"
-    except Exception:
-        return f"CPU: {cpu_percent:.1f}%"
+    cpu_percent = _cache.cpu_val
+    throttle = _cache.throttle_short
+    return f"CPU: {cpu_percent:.1f}%{throttle}"
 
 def mem_line():
-    vm = psutil.virtual_memory()
-    used = vm.total - vm.available
-    return f"Mem:{bytes2human(used)}/{bytes2human(vm.total)} {int(vm.percent)}%"
+    used, total, percent = _cache.mem_val
+    return f"Mem:{used}/{total} {percent}%"
 
 def disk_line():
-    du = shutil.disk_usage("/")
-    used = du.total - du.free
-    return f"Disk: {bytes2human(used)}/{bytes2human(du.total)} {int(100*used/du.total)}%"
+    used, total, percent = _cache.disk_val
+    return f"Disk: {used}/{total} {percent}%"
 
 def temp_line():
     """Get CPU temperature and detailed throttling info"""
-    vcgencmd_data = get_cached_vcgencmd_data()
-    
-    try:
-        # Parse cached temperature
-        temp = "N/A"
-        temp_match = re.search(r'temp=([0-9.]+)', vcgencmd_data['temp'])
-        if temp_match:
-            temp = f"{float(temp_match.group(1)):.1f}°C"
-        
-        # Parse cached throttling data
-        throttle_info = ""
-        throttled_hex = vcgencmd_data['throttled'].split('=')[1]
-        throttled_val = int(throttled_hex, 16)
-        
-        # Check various throttling conditions
-        if throttled_val & 0x1:    # Under-voltage detected
-            throttle_info += "UV "
-        if throttled_val & 0x2:    # Currently throttled
-            throttle_info += "THROT "
-        if throttled_val & 0x4:    # Currently capped
-            throttle_info += "CAP "
-        if throttled_val & 0x8:    # Currently soft temperature limit
-            throttle_info += "SOFT "
-            
-        # Historical flags (bits 16-19)
-        if throttled_val & 0x10000:  # Under-voltage has occurred
-            throttle_info += "UV-H "
-        if throttled_val & 0x20000:  # Throttling has occurred  
-            throttle_info += "TH-H "
-        
-        if throttle_info:
-            return f"Temp: {temp} {throttle_info.strip()}"
-        else:
-            return f"Temp: {temp}"
-            
-    except Exception:
+    if _cache.temp_c is None:
         return "Temp: N/A"
+    temp = f"{_cache.temp_c:.1f}°C"
+    
+    throttle_info = _cache.throttle_long
+    if throttle_info:
+        return f"Temp: {temp} {throttle_info}"
+    return f"Temp: {temp}"
 
 # ---------- Anti Burn-in ----------
 class BurnInShifter:
@@ -199,7 +292,7 @@ class BurnInShifter:
     def __init__(self, max_x, shift_seconds):
         self.max_x = max_x
         self.shift_seconds = shift_seconds
-        self.last_shift = time.monotonic()
+        self.next_shift = time.monotonic() + shift_seconds
         # Generate sweep pattern: 0,1,2,3,2,1,0,-1,-2,-3,-2,-1
         self._positions = self._generate_sweep()
         self._pos_idx = 0
@@ -225,61 +318,282 @@ class BurnInShifter:
     def update(self):
         """Check if it's time to shift and update offset"""
         now = time.monotonic()
-        if now - self.last_shift >= self.shift_seconds:
-            self._pos_idx = (self._pos_idx + 1) % len(self._positions)
-            self.offset_x = self._positions[self._pos_idx]
-            self.last_shift = now
-            return True
-        return False
+        if now < self.next_shift:
+            return False
+        self._pos_idx = (self._pos_idx + 1) % len(self._positions)
+        self.offset_x = self._positions[self._pos_idx]
+        self.next_shift = now + self.shift_seconds
+        return True
 
 # ---------- Display ----------
+class BatchedI2C(i2c):
+    """
+    luma i2c interface that queues command bytes and sends them together
+    with the following data in a single I²C write. Commands are framed with
+    the SSD1306 continuation control byte (0x80) and the data run with 0x40,
+    so a whole frame update costs one write instead of several. Command-only
+    sequences are sent on flush(). Falls back to luma's immediate writes
+    when given an unmanaged (non-smbus2) bus.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = bytearray()
+
+    def command(self, *cmd):
+        if not self._managed:
+            return super().command(*cmd)
+        for c in cmd:
+            self._pending += bytes((0x80, c))
+
+    def data(self, data):
+        if not self._managed:
+            return super().data(data)
+        self._pending.append(self._data_mode)
+        self._pending += bytes(data)
+        self.flush()
+
+    def flush(self):
+        """Send everything queued as one I²C write"""
+        if not self._pending:
+            return
+        msg = self._i2c_msg_write(self._addr, self._pending)
+        self._pending = bytearray()
+        try:
+            self._bus.i2c_rdwr(msg)
+        except (IOError, OSError) as e:
+            if e.errno in [errno.EREMOTEIO, errno.EIO]:
+                raise luma.core.error.DeviceNotFoundError(
+                    'I2C device not found on address: 0x{0:02X}'.format(self._addr))
+            raise
+
+    def cleanup(self):
+        # luma's shutdown hook ends with command-only writes (display off)
+        self.flush()
+        super().cleanup()
+
+class PagedSSD1306(ssd1306):
+    """
+    ssd1306 that takes frames already packed in its page format (byte
+    `page * width + x`, bit `y % 8`) and can flush a range of 8-pixel pages
+    instead of the whole framebuffer. On 128x32 each text line covers two of
+    the four pages, so a single-line update halves the bytes sent over I²C.
+    Frames are sent as-is, so the device must not be rotated.
+    """
+    def display_pages(self, buf, page_start, page_end):
+        """Send pages page_start..page_end (inclusive) of a packed frame"""
+        self.command(
+            # Column start/end address
+            self._const.COLUMNADDR, self._colstart, self._colend - 1,
+            # Page start/end address
+            self._const.PAGEADDR, page_start, page_end)
+        self.data(buf[page_start * self._w:(page_end + 1) * self._w])
+
 def make_device():
-    serial = i2c(port=I2C_PORT, address=I2C_ADDR)
-    return ssd1306(serial, width=128, height=32)
+    serial = BatchedI2C(port=I2C_PORT, address=I2C_ADDR)
+    device = PagedSSD1306(serial, width=128, height=32)
+    serial.flush()  # init sequence ends with a command-only "display on"
+    return device
+
+@dataclass
+class FrameBuffer:
+    """Persistent frame in SSD1306 page format, composed without PIL"""
+    width: int
+    n_pages: int
+    pages: bytearray
+
+    @classmethod
+    def for_device(cls, device):
+        n_pages = device.height // 8
+        return cls(device.width, n_pages, bytearray(device.width * n_pages))
+
+class DisplayFlusher:
+    """
+    Push frames to the device from a background thread, so the I²C transfer
+    overlaps with rendering the next frame. Only the newest pending frame is
+    kept; a stale one still waiting in the queue is replaced. Frames are
+    copied into recycled buffers (at most three ever exist), so steady-state
+    submits allocate nothing. Each frame carries the page range that changed;
+    a replaced frame's range is merged into its successor's.
+    """
+    def __init__(self, device):
+        self.device = device
+        self._queue = queue.Queue(maxsize=1)
+        self._free = queue.SimpleQueue()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="display-flush", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame, pages):
+        """Queue a snapshot of a packed frame and its (first, last) dirty pages"""
+        if self._error is not None:
+            # Surface I²C failures in the main loop so the service restarts
+            raise self._error
+        try:
+            buf = self._free.get_nowait()
+            buf[:] = frame
+        except queue.Empty:
+            buf = bytearray(frame)
+        try:
+            self._queue.put_nowait((buf, pages))
+        except queue.Full:
+            try:
+                stale, stale_pages = self._queue.get_nowait()
+                self._free.put(stale)
+                pages = (min(pages[0], stale_pages[0]), max(pages[1], stale_pages[1]))
+            except queue.Empty:
+                pass
+            self._queue.put_nowait((buf, pages))
+
+    def close(self):
+        """Let the worker finish the pending frame, then stop it"""
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            frame, (page_start, page_end) = item
+            try:
+                self.device.display_pages(frame, page_start, page_end)
+            except Exception as e:
+                self._error = e
+                return
+            self._free.put(frame)
 
 # --- marquee helpers ---
 def init_state():
-    return {"text": None, "img": None, "w": 0, "x": 0, "scroll": False, "text_template": None}
+    return {"text": None, "strip": None, "w": 0, "x": 0, "scroll": False, "text_template": None}
 
-def render_text_image(text, font):
+# Glyph atlas: per-font {char: 1-bit Image}, so stat lines are composed by
+# pasting pre-rasterized glyphs instead of running FreeType on every change
+ATLAS_CHARS = string.digits + string.ascii_letters + string.punctuation + " °"
+_glyph_atlases = {}
+
+# Shared scratch context for text measurement, and line height per font
+_SCRATCH_DRAW = ImageDraw.Draw(Image.new("1", (1, 1)))
+_font_heights = {}
+
+def font_height(font):
+    """Line height from font metrics (cached per font); fallback to 12"""
+    h = _font_heights.get(font)
+    if h is None:
+        try:
+            h = font.getbbox("Ay")[3]
+        except Exception:
+            h = 12
+        _font_heights[font] = h
+    return h
+
+def rasterize_text(text, font):
     # Render to exact-width 1-bit image so we can scroll precisely
-    tmp = Image.new("1", (1, 1))
-    d = ImageDraw.Draw(tmp)
-    w = int(d.textlength(text, font=font))
-    w = max(w, 1)
-    # height from font metrics; fallback to 12
-    try:
-        h = font.getbbox("Ay")[3]
-    except Exception:
-        h = 12
-    img = Image.new("1", (w, h), 0)
-    ImageDraw.Draw(img).text((0, 0), text, font=font, fill=1)
+    w = max(int(_SCRATCH_DRAW.textlength(text, font=font)), 1)
+    img = Image.new("1", (w, font_height(font)), 0)
+    if isinstance(font, ImageFont.FreeTypeFont):
+        # Paste the 1-bit glyph mask directly, skipping ImageDraw.text dispatch
+        mask, (ox, oy) = font.getmask2(text, mode="1")
+        img.im.paste(1, (ox, oy, ox + mask.size[0], oy + mask.size[1]), mask)
+    else:
+        ImageDraw.Draw(img).text((0, 0), text, font=font, fill=1)
     return img
 
+def build_glyph_atlas(font):
+    """Pre-rasterize ATLAS_CHARS once for a monospaced FreeType font"""
+    if font in _glyph_atlases or not isinstance(font, ImageFont.FreeTypeFont):
+        return
+    # Composing glyphs only matches a direct render if every glyph's ink sits
+    # inside its own whole-pixel advance cell. Proportional fonts, and
+    # monospaced ones at sizes where a glyph overhangs (e.g. DejaVu Sans
+    # Mono's 'R' leg at 10-14px), would be clipped; those just rasterize.
+    advances = {_SCRATCH_DRAW.textlength(ch, font=font) for ch in ATLAS_CHARS}
+    if len(advances) != 1:
+        return
+    advance = advances.pop()
+    if advance != int(advance):
+        return
+    for ch in ATLAS_CHARS:
+        # Extent of the 1-bit mask itself: getbbox() measures the outline,
+        # which can be a pixel narrower than what mode "1" draws
+        mask, (left, _) = font.getmask2(ch, mode="1")
+        if left < 0 or left + mask.size[0] > advance:
+            return
+    _glyph_atlases[font] = {ch: rasterize_text(ch, font) for ch in ATLAS_CHARS}
+
+def compose_text_image(text, atlas):
+    """Compose a line from atlas glyphs laid out at their advance widths"""
+    glyphs = [atlas[ch] for ch in text]
+    img = Image.new("1", (max(sum(g.width for g in glyphs), 1), glyphs[0].height), 0)
+    x = 0
+    for g in glyphs:
+        img.paste(g, (x, 0))
+        x += g.width
+    return img
+
+def render_text_image(text, font):
+    atlas = _glyph_atlases.get(font)
+    if atlas is None or not text or not all(ch in atlas for ch in text):
+        # No atlas for this font or a glyph outside it; rasterize directly
+        return rasterize_text(text, font)
+    return compose_text_image(text, atlas)
+
+def pack_pages(img):
+    """
+    Pack a 1-bit image into SSD1306 page format: one bytearray of column
+    bytes per 8-row page, bit 0 being the top row of the page.
+    """
+    w, h = img.size
+    n_pages = (h + 7) // 8
+    if h % 8:
+        padded = Image.new("1", (w, n_pages * 8), 0)
+        padded.paste(img, (0, 0))
+        img = padded
+    # Rotated clockwise, each raster row is one source column packed 8 pixels
+    # per byte MSB first, so byte j is page n_pages-1-j with its top row in
+    # bit 0: PIL does the bit packing, each page is one strided slice
+    data = img.transpose(Image.Transpose.ROTATE_270).tobytes()
+    return [bytearray(data[n_pages - 1 - p::n_pages]) for p in range(n_pages)]
+
+@functools.lru_cache(maxsize=64)
+def render_text_strip(text, font):
+    # Cached per (text, font): callers only read from the returned strip.
+    return pack_pages(render_text_image(text, font))
+
+@functools.lru_cache(maxsize=32)
 def get_text_template(text):
     """Extract template from text by replacing numbers/percentages with placeholders"""
-    import re
-    # Replace sequences of digits, decimal numbers, and percentages with placeholders
-    template = re.sub(r'\d+\.?\d*%?', '#', text)
-    # Replace IP addresses with placeholder
-    template = re.sub(r'\d+\.\d+\.\d+\.\d+', '#.#.#.#', template)
-    return template
-
-def should_preserve_scroll_position(old_text, new_text):
+    return _TEMPLATE_RE.sub(lambda m: '#.#.#.#' if m.group(1) else '#', text)
+
+def should_preserve_scroll_position(old_template, new_template):
     """Check if scroll position should be preserved (text structure is similar)"""
-    if old_text is None or new_text is None:
+    if old_template is None or new_template is None:
         return False
-    return get_text_template(old_text) == get_text_template(new_text)
+    return old_template == new_template
 
 def ensure_state_for_text(state, text, font, screen_w):
+    """Update marquee state for new text; returns True if the text changed"""
     if text != state["text"]:
+        # Cheap length/prefix bail-out first: rotating to a different stat
+        # never needs the regex. Templates are kept in state (computed lazily
+        # for the old text if its own transition skipped them).
         old_text = state["text"]
-        preserve_scroll = should_preserve_scroll_position(old_text, text)
+        template = None
+        if old_text is not None and abs(len(old_text) - len(text)) <= 4 and old_text[:3] == text[:3]:
+            if state["text_template"] is None:
+                state["text_template"] = get_text_template(old_text)
+            template = get_text_template(text)
+        preserve_scroll = should_preserve_scroll_position(state["text_template"], template)
         
         state["text"] = text
-        state["img"] = render_text_image(text, font)
+        state["text_template"] = template
+        state["strip"] = render_text_strip(text, font)
         old_w = state["w"]
-        state["w"] = state["img"].width
+        state["w"] = len(state["strip"][0])
         state["scroll"] = state["w"] > screen_w
         
         if not preserve_scroll or not state["scroll"]:
@@ -292,32 +606,79 @@ def ensure_state_for_text(state, text, font, screen_w):
                 if old_w > 0:
                     ratio = state["w"] / old_w
                     state["x"] = int(state["x"] * ratio)
-
-def draw_marquee_line(draw, y, state, screen_w, gap_px, speed_px, offset_x=0):
-    """Draw a marquee line with optional horizontal offset for burn-in protection."""
-    if not state["scroll"]:
-        draw.bitmap((offset_x, y), state["img"], fill=1)
-        return
-    x = state["x"] + offset_x
-    draw.bitmap((x, y), state["img"], fill=1)
-    x2 = x + state["w"] + gap_px
-    if x2 < screen_w:
-        draw.bitmap((x2, y), state["img"], fill=1)
+        return True
+    return False
+
+def marquee_row(state, strip_page, screen_w, gap_px, offset_x=0):
+    """One page row (screen_w column bytes) of a marquee line at its current position."""
+    src = state["strip"][strip_page]
+    row = bytearray(screen_w)
+    if state["scroll"]:
+        x = state["x"] + offset_x
+        x2 = x + state["w"] + gap_px
+        positions = (x, x2) if x2 < screen_w else (x,)
+    else:
+        positions = (offset_x,)
+    for x in positions:
+        # Clip the strip to the screen and copy it in with one slice assignment
+        src_x = max(0, -x)
+        dst_x = max(0, x)
+        n = min(len(src) - src_x, screen_w - dst_x)
+        if n > 0:
+            row[dst_x:dst_x + n] = src[src_x:src_x + n]
+    return row
+
+def advance_marquee(state, gap_px, speed_px):
     # advance & wrap
     state["x"] -= speed_px
     total = state["w"] + gap_px
     if state["x"] < -total:
         state["x"] += total
 
+def redraw_lines(fb, lines, gap_px):
+    """
+    Partial invalidation of the persistent frame. `lines` holds
+    (state, y, offset_x, dirty) tuples with page-aligned y; every page a
+    dirty line covers is recomposed from all lines overlapping it (top-line
+    descenders reach into the bottom line's first page, so rows are OR-ed).
+    Returns the (first, last) range of pages whose bytes changed, or None.
+    """
+    if not any(line[3] for line in lines):
+        # Static frame: the backbuffer already holds both lines, touch nothing
+        return None
+    w = fb.width
+    spans = [(y // 8, min(y // 8 + len(state["strip"]), fb.n_pages)) for state, y, _, _ in lines]
+    dirty = sorted({page for (p0, p1), line in zip(spans, lines) if line[3] for page in range(p0, p1)})
+    changed = []
+    for page in dirty:
+        rows = [marquee_row(state, page - p0, w, gap_px, offset_x)
+                for (state, _, offset_x, _), (p0, p1) in zip(lines, spans) if p0 <= page < p1]
+        if len(rows) == 1:
+            new = rows[0]
+        else:
+            merged = 0
+            for row in rows:
+                merged |= int.from_bytes(row, "little")
+            new = merged.to_bytes(w, "little")
+        start = page * w
+        # Skip the I²C transfer for pages that came out pixel-identical
+        if fb.pages[start:start + w] != new:
+            fb.pages[start:start + w] = new
+            changed.append(page)
+    if not changed:
+        return None
+    return changed[0], changed[-1]
+
 # ---------- Main ----------
 def main():
     device = make_device()
     font_top = load_font(FONT_SIZE_TOP)
     font_bottom = load_font(FONT_SIZE_BOTTOM)
+    build_glyph_atlas(font_top)
+    build_glyph_atlas(font_bottom)
 
-    # Initialize CPU monitoring (first call always returns 0.0)
-    psutil.cpu_percent()
-
+    # The top line never changes; the stat line is cached by get_cached_stat_line
+    line1 = HOSTNAME
     stats = [up_line, ip_line, load_line, mem_line, disk_line, temp_line]
     idx = 0
     last_rotate = time.monotonic()
@@ -328,33 +689,82 @@ def main():
     # Anti burn-in: horizontal sweep for static content
     burnin_shifter = BurnInShifter(BURNIN_SHIFT_MAX_X, BURNIN_SHIFT_SECONDS)
 
-    while True:
-        now = time.monotonic()
+    # Persistent backbuffer: only the pages of lines that changed get redrawn
+    fb = FrameBuffer.for_device(device)
+    flusher = DisplayFlusher(device)
 
-        # Update burn-in protection offset
-        burnin_shifter.update()
+    # Signals end the frame wait early through a wakeup pipe: SIGUSR1 rotates
+    # to the next stat right away, SIGTERM (systemctl stop) exits cleanly
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_r, False)
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+    signal.signal(signal.SIGUSR1, lambda *_: None)
+    signal.signal(signal.SIGTERM, lambda *_: None)
+    rotate_now = False
 
-        line1 = host_line()
-        line2 = stats[idx % len(stats)]()
+    # Frame pacing: wait until the next tick instead of a fixed delay
+    deadline = time.monotonic()
 
-        ensure_state_for_text(top_state, line1, font_top, device.width)
-        ensure_state_for_text(bottom_state, line2, font_bottom, device.width)
+    try:
+        while True:
+            now = time.monotonic()
 
-        with canvas(device) as draw:
-            # Top line uses horizontal sweep for burn-in protection
-            draw_marquee_line(
-                draw, 0, top_state, device.width,
-                SCROLL_GAP_PX, SCROLL_SPEED_PX,
-                offset_x=burnin_shifter.offset_x
-            )
-            # Bottom line scrolls naturally, no burn-in concern
-            draw_marquee_line(draw, 16, bottom_state, device.width, SCROLL_GAP_PX, SCROLL_SPEED_PX)
+            # Update burn-in protection offset
+            shifted = burnin_shifter.update()
+
+            # Stat sources are sampled here, before any producer reads them; the
+            # first CPU sample only primes the delta and reads 0.0
+            refresh_cache(_cache, now)
 
-        if (now - last_rotate) >= ROTATE_SECONDS:
-            idx += 1
-            last_rotate = now
+            if rotate_now or (now - last_rotate) >= ROTATE_SECONDS:
+                idx += 1
+                last_rotate = now
+                rotate_now = False
 
-        time.sleep(SCROLL_TICK_S)
+            line2 = get_cached_stat_line(_cache, stats, idx, now)
+
+            top_changed = ensure_state_for_text(top_state, line1, font_top, device.width)
+            bottom_changed = ensure_state_for_text(bottom_state, line2, font_bottom, device.width)
+
+            lines = (
+                # Top line uses horizontal sweep for burn-in protection
+                (top_state, 0, burnin_shifter.offset_x, top_changed or shifted or top_state["scroll"]),
+                # Bottom line scrolls naturally, no burn-in concern
+                (bottom_state, 16, 0, bottom_changed or bottom_state["scroll"]),
+            )
+            # Only send the pages that differ from the last frame
+            pages = redraw_lines(fb, lines, SCROLL_GAP_PX)
+            if pages is not None:
+                flusher.submit(fb.pages, pages)
+            for state in (top_state, bottom_state):
+                if state["scroll"]:
+                    advance_marquee(state, SCROLL_GAP_PX, SCROLL_SPEED_PX)
+
+            if top_state["scroll"] or bottom_state["scroll"]:
+                deadline += SCROLL_TICK_S
+            else:
+                # Static frame: nothing can change before the next rotation, stat
+                # refresh or burn-in shift, so sleep until the earliest of those
+                idle_s = min(last_rotate + ROTATE_SECONDS - now,
+                             _cache.stat_time + STAT_REFRESH_SECONDS - now,
+                             burnin_shifter.next_shift - now)
+                deadline = now + max(idle_s, SCROLL_TICK_S)
+            slack = deadline - time.monotonic()
+            if slack <= 0:
+                # Overran the frame budget; resync instead of bursting to catch up
+                deadline = time.monotonic()
+            if select.select([wake_r], [], [], max(slack, 0))[0]:
+                signals = os.read(wake_r, 64)
+                if signal.SIGTERM in signals:
+                    break
+                elif signal.SIGUSR1 in signals:
+                    rotate_now = True
+                    deadline = time.monotonic()
+    finally:
+        # SIGTERM and Ctrl-C alike: drain the pending frame before luma's
+        # exit handler clears the panel from this thread
+        flusher.close()
 
 if __name__ == "__main__":
     try: